@@ -1,7 +1,42 @@
 """Spectral parameterization."""
 
+from importlib import import_module
+
 from .version import __version__
 
-from .bands import Bands
-from .objs import SpectralModel, SpectralGroupModel, SpectralTimeModel, SpectralTimeEventModel
-from .objs.utils import fit_models_3d
+###################################################################################################
+###################################################################################################
+
+# Map of exported attributes to the sub-modules that define them
+#   These are imported lazily, upon first access (PEP 562), to cut import latency
+_LAZY_IMPORTS = {
+    'Bands' : '.bands',
+    'SpectralModel' : '.objs',
+    'SpectralGroupModel' : '.objs',
+    'SpectralTimeModel' : '.objs',
+    'SpectralTimeEventModel' : '.objs',
+    'fit_models_3d' : '.objs.utils',
+}
+
+# Public sub-modules, also importable lazily upon attribute access
+_LAZY_MODULES = ['analysis', 'bands', 'data', 'objs', 'plts', 'sim', 'utils']
+
+__all__ = sorted(_LAZY_IMPORTS)
+
+def __getattr__(name):
+    """Lazily import an exported attribute or sub-module on first access, caching it."""
+
+    if name in _LAZY_IMPORTS:
+        out = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = out
+        return out
+
+    if name in _LAZY_MODULES:
+        out = import_module('.' + name, __name__)
+        globals()[name] = out
+        return out
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__():
+    return __all__ + _LAZY_MODULES + ['__version__']
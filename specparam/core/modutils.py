@@ -65,15 +65,22 @@ def check_dependency(dep, name):
     ------
     ImportError
         If the requested dependency is not available.
+
+    Notes
+    -----
+    If the dependency is available at decoration time, the function is returned
+    unwrapped, so the availability check adds no overhead to each call.
     """
 
     def wrap(func):
+
+        if dep:
+            return func
+
         @wraps(func)
         def wrapped_func(*args, **kwargs):
-            if not dep:
-                raise ImportError("Optional dependency " + name + \
-                                  " is required for this functionality.")
-            return func(*args, **kwargs)
+            raise ImportError("Optional dependency " + name + \
+                              " is required for this functionality.")
         return wrapped_func
     return wrap
 
@@ -1,8 +1,33 @@
 """Objects sub-module, for model objects and functions that operate on model objects."""
 
-from .fit import SpectralModel
-from .group import SpectralGroupModel
-from .time import SpectralTimeModel
-from .event import SpectralTimeEventModel
-from .utils import (compare_model_objs, average_group, average_reconstructions,
-                    combine_model_objs, fit_models_3d)
+from importlib import import_module
+
+###################################################################################################
+###################################################################################################
+
+# Map of exported attributes to the sub-modules that define them
+#   These are imported lazily, upon first access (PEP 562), to cut import latency
+_LAZY_IMPORTS = {
+    'SpectralModel' : '.fit',
+    'SpectralGroupModel' : '.group',
+    'SpectralTimeModel' : '.time',
+    'SpectralTimeEventModel' : '.event',
+    'compare_model_objs' : '.utils',
+    'average_group' : '.utils',
+    'average_reconstructions' : '.utils',
+    'combine_model_objs' : '.utils',
+    'fit_models_3d' : '.utils',
+}
+
+def __getattr__(name):
+    """Lazily import an exported attribute on first access, caching it in the module."""
+
+    if name in _LAZY_IMPORTS:
+        out = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = out
+        return out
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__():
+    return sorted(_LAZY_IMPORTS)
@@ -0,0 +1,71 @@
+"""Numba-accelerated histogram binning for plots.
+
+Notes
+-----
+This binning is only used if numba is available, and should be considered private.
+"""
+
+from specparam.core.modutils import safe_import
+
+###################################################################################################
+###################################################################################################
+
+# Resolved histogram counter - False marks not yet resolved, None marks numba unavailable
+_hist1d = False
+
+def get_hist1d():
+    """Get the jit-compiled histogram counter, if available.
+
+    Returns
+    -------
+    hist1d : callable or None
+        The jit-compiled histogram counter, or None if numba is not available.
+
+    Notes
+    -----
+    The numba import and compilation are deferred until the first call,
+    so that importing the module does not pay the numba import cost.
+    """
+
+    global _hist1d
+    if _hist1d is False:
+
+        numba = safe_import('numba')
+        if numba:
+
+            @numba.njit(cache=True, fastmath=True)
+            def hist1d(data, lo, hi, n_bins, out):
+                """Count histogram bin membership for a 1d array of finite data.
+
+                Parameters
+                ----------
+                data : 1d array of float
+                    Data to bin. Values outside of [lo, hi] are ignored.
+                lo, hi : float
+                    Lower and upper bounds of the histogram range. Must satisfy hi > lo.
+                n_bins : int
+                    Number of histogram bins.
+                out : 1d array of int
+                    Output array to accumulate bin counts into, of length `n_bins`.
+
+                Notes
+                -----
+                Matches `np.histogram` binning, including the upper bound counting
+                into the last bin.
+                """
+
+                inv = n_bins / (hi - lo)
+                for val in data:
+                    if val < lo or val > hi:
+                        continue
+                    ind = int((val - lo) * inv)
+                    if ind == n_bins:
+                        ind = n_bins - 1
+                    out[ind] += 1
+
+            _hist1d = hist1d
+
+        else:
+            _hist1d = None
+
+    return _hist1d
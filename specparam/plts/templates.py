@@ -6,13 +6,14 @@ These are template plot structures for plots and/or reports.
 They are not expected to be used directly by the user.
 """
 
-from itertools import repeat, cycle
+from itertools import cycle, islice
 
 import numpy as np
 
 from specparam.utils.data import compute_average, compute_dispersion
 from specparam.core.modutils import safe_import, check_dependency
 from specparam.plts.utils import check_ax, set_alpha
+from specparam.plts._numba_hist import get_hist1d
 from specparam.plts.settings import (PLT_FIGSIZES, DEFAULT_COLORS, PLT_TEXT_FONT,
                                      TITLE_FONTSIZE, LABEL_SIZE, TICK_LABELSIZE)
 
@@ -21,6 +22,41 @@ plt = safe_import('.pyplot', 'matplotlib')
 ###################################################################################################
 ###################################################################################################
 
+# Initialize a random number generator for creating jitter values, seeded to match the test seed
+_JITTER_RNG = np.random.default_rng(13)
+
+def _make_jitter():
+    """Create a jitter function that reuses a single scratch buffer across calls."""
+
+    buf = np.empty(1024)
+
+    def jitter(n_points):
+        """Draw jitter values (sigma 0.025) into a reused scratch buffer.
+
+        Returns a view into the buffer, valid until the next call - so repeated
+        plot calls stay allocation-free, aside from growing the buffer on demand.
+        """
+
+        nonlocal buf
+        if n_points > buf.size:
+            buf = np.empty(n_points)
+
+        out = buf[:n_points]
+        _JITTER_RNG.standard_normal(out=out)
+        out *= 0.025
+
+        return out
+
+    return jitter
+
+_jitter = _make_jitter()
+
+# Pre-resolve the default figure size for the parameters over time plots
+_TIME_FIGSIZE = PLT_FIGSIZES['time']
+
+###################################################################################################
+###################################################################################################
+
 @check_dependency(plt, 'matplotlib')
 def plot_scatter_1(data, label=None, title=None, x_val=0, ax=None):
     """Plot a scatter plot, with a single y-axis.
@@ -46,7 +82,9 @@ def plot_scatter_1(data, label=None, title=None, x_val=0, ax=None):
     ax = check_ax(ax)
 
     # Create x-axis data, with small jitter for visualization purposes
-    x_data = np.ones_like(data) * x_val + np.random.normal(0, 0.025, data.shape)
+    #   The jitter buffer can be updated in place, as scatter copies its inputs
+    x_data = _jitter(len(data))
+    x_data += x_val
 
     ax.scatter(x_data, data, s=36, alpha=set_alpha(len(data)))
 
@@ -57,8 +95,7 @@ def plot_scatter_1(data, label=None, title=None, x_val=0, ax=None):
     if title:
         ax.set_title(title, fontsize=TITLE_FONTSIZE)
 
-    ax.tick_params(axis='x', labelsize=TICK_LABELSIZE)
-    ax.tick_params(axis='y', labelsize=TICK_LABELSIZE)
+    ax.tick_params(axis='both', labelsize=TICK_LABELSIZE)
 
     ax.set_xlim([-0.5, 0.5])
 
@@ -103,7 +140,56 @@ def plot_scatter_2(data_0, label_0, data_1, label_1, title=None, ax=None):
 
 
 @check_dependency(plt, 'matplotlib')
-def plot_hist(data, label, title=None, n_bins=25, x_lims=None, ax=None):
+def plot_scatter_n(datas, labels, title=None, ax=None):
+    """Plot multiple sets of data as a single scatter plot, with a shared y-axis.
+
+    Parameters
+    ----------
+    datas : list of 1d array
+        Sets of data to plot, one per x-axis position.
+    labels : list of str
+        Labels for the sets of data, to be set as the x-axis tick labels.
+    title : str, optional
+        Title for the plot.
+    ax : matplotlib.Axes, optional
+        Figure axes upon which to plot.
+
+    Notes
+    -----
+    Data is jittered slightly, for visualization purposes (deviations on x-axis are meaningless).
+
+    All sets of data are concatenated and plotted with a single scatter call, which is
+    preferable to repeated `plot_scatter_1` calls when plotting many sets in a loop.
+    Note that all sets share a single y-axis - use `plot_scatter_2` for independent y-axes.
+    """
+
+    ax = check_ax(ax)
+
+    # Concatenate all data into single x & y arrays, with per-set x positions plus jitter
+    #   The jitter buffer can be updated in place, as scatter copies its inputs
+    n_points = sum(len(data) for data in datas)
+    x_data = _jitter(n_points)
+    y_data = np.empty(n_points)
+    start = 0
+    for ind, data in enumerate(datas):
+        stop = start + len(data)
+        x_data[start:stop] += ind
+        y_data[start:stop] = data
+        start = stop
+
+    ax.scatter(x_data, y_data, s=36, alpha=set_alpha(n_points // len(datas)))
+
+    if title:
+        ax.set_title(title, fontsize=TITLE_FONTSIZE)
+
+    ax.set(xlim=[-0.5, len(datas) - 0.5],
+           xticks=list(range(len(datas))),
+           xticklabels=labels)
+    ax.tick_params(axis='both', labelsize=TICK_LABELSIZE)
+
+
+@check_dependency(plt, 'matplotlib')
+def plot_hist(data, label, title=None, n_bins=25, x_lims=None, skip_nan_check=False, ax=None):
     """Plot a histogram.
 
     Parameters
@@ -118,13 +204,32 @@ def plot_hist(data, label, title=None, n_bins=25, x_lims=None, ax=None):
         Number of bins to use for the histogram.
     x_lims : list of float, optional
         Limits for the x-axis of the plot.
+    skip_nan_check : bool, optional, default: False
+        Whether to skip checking for and dropping non-finite data values.
+        Can be set to True if the data is known to be finite, to skip a pass through the data.
     ax : matplotlib.Axes, optional
         Figure axes upon which to plot.
     """
 
     ax = check_ax(ax)
 
-    ax.hist(data[~np.isnan(data)], n_bins, range=x_lims, alpha=0.8)
+    hist_data = data.ravel() if skip_nan_check else data[np.isfinite(data)]
+
+    # Check whether the numba-accelerated binning can be used for the current data
+    hist1d = get_hist1d()
+    use_numba = hist1d is not None and len(hist_data) > 0
+    if use_numba:
+        lo, hi = x_lims if x_lims else (float(np.min(hist_data)), float(np.max(hist_data)))
+        use_numba = hi > lo
+
+    # If available, count the bins directly and plot as bars, otherwise let matplotlib bin
+    if use_numba:
+        counts = np.zeros(n_bins, dtype=np.int64)
+        hist1d(np.asarray(hist_data, dtype=np.float64), lo, hi, n_bins, counts)
+        edges = np.linspace(lo, hi, n_bins + 1)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.8)
+    else:
+        ax.hist(hist_data, n_bins, range=x_lims, alpha=0.8)
 
     ax.set_xlabel(label, fontsize=LABEL_SIZE)
     ax.set_ylabel('Count', fontsize=LABEL_SIZE)
@@ -190,7 +295,8 @@ def plot_yshade(x_vals, y_vals, average='mean', shade='std', scale=1., color=Non
 
 @check_dependency(plt, 'matplotlib')
 def plot_param_over_time(times, param, label=None, title=None, add_legend=True, add_xlabel=True,
-                         xlim=None, drop_xticks=False, ax=None, **plot_kwargs):
+                         xlim=None, drop_xticks=False, figsize=None, alpha=0.8,
+                         legend_framealpha=0.9, ax=None, **plot_kwargs):
     """Plot a parameter over time.
 
     Parameters
@@ -206,20 +312,24 @@ def plot_param_over_time(times, param, label=None, title=None, add_legend=True,
         Whether to add a legend to the plot.
     add_xlabel : bool, optional, default: True
         Whether to add an x-label to the plot.
+    figsize : tuple of float, optional
+        Size to create the figure, if not already created.
+    alpha : float, optional, default: 0.8
+        Transparency of the plotted line.
+    legend_framealpha : float, optional, default: 0.9
+        Transparency of the legend frame.
     ax : matplotlib.Axes, optional
         Figure axes upon which to plot.
     **plot_kwargs
         Additional keyword arguments for the plot call.
     """
 
-    ax = check_ax(ax, plot_kwargs.pop('figsize', PLT_FIGSIZES['time']))
+    ax = check_ax(ax, figsize if figsize is not None else _TIME_FIGSIZE)
 
     if times is None:
         times = np.arange(0, len(param))
 
-    ax.plot(times, param, label=label,
-            alpha=plot_kwargs.pop('alpha', 0.8),
-            **plot_kwargs)
+    ax.plot(times, param, label=label, alpha=alpha, **plot_kwargs)
 
     if add_xlabel:
         ax.set_xlabel('Time Window')
@@ -232,7 +342,7 @@ def plot_param_over_time(times, param, label=None, title=None, add_legend=True,
         ax.set_xlim(xlim)
 
     if label and add_legend:
-        ax.legend(loc='upper left', framealpha=plot_kwargs.pop('legend_framealpha', 0.9))
+        ax.legend(loc='upper left', framealpha=legend_framealpha)
 
     if title:
         ax.set_title(title)
@@ -260,25 +370,39 @@ def plot_params_over_time(times, params, labels=None, title=None, colors=None,
         Additional keyword arguments for the plot call.
     """
 
-    labels = repeat(labels) if not isinstance(labels, list) else cycle(labels)
-    colors = cycle(DEFAULT_COLORS) if not isinstance(colors, list) else cycle(colors)
-
-    ax0 = check_ax(ax, plot_kwargs.pop('figsize', PLT_FIGSIZES['time']))
-
     n_axes = len(params)
-    axes = [ax0] + [ax0.twinx() for ind in range(n_axes-1)]
 
-    if n_axes >= 3:
-        for nax, ind in enumerate(range(2, n_axes)):
-            axes[ind].spines.right.set_position(("axes", 1.1 + (.1 * nax)))
+    # Normalize label & color inputs into one-per-axis lists
+    if labels is None:
+        labels = [None] * n_axes
+    elif isinstance(labels, str):
+        labels = [labels] + [None] * (n_axes - 1)
+    else:
+        labels = list(islice(cycle(labels), n_axes))
+    colors = list(islice(cycle(colors if colors is not None else DEFAULT_COLORS), n_axes))
+
+    # Collect any shared plot settings once, rather than re-popping them per parameter
+    figsize = plot_kwargs.pop('figsize', None)
+    alpha = plot_kwargs.pop('alpha', 0.8)
+    legend_framealpha = plot_kwargs.pop('legend_framealpha', 0.9)
+
+    ax0 = check_ax(ax, figsize if figsize is not None else _TIME_FIGSIZE)
+
+    # Create any additional axes, offsetting the right spine of the third & further axes
+    axes = [ax0]
+    for ind in range(1, n_axes):
+        cur_ax = ax0.twinx()
+        if ind >= 2:
+            cur_ax.spines.right.set_position(("axes", 1.1 + (.1 * (ind - 2))))
+        axes.append(cur_ax)
 
     for cax, cparams, label, color in zip(axes, params, labels, colors):
         plot_param_over_time(times, cparams, label, add_legend=False, color=color,
-                             ax=cax, **plot_kwargs)
+                             alpha=alpha, ax=cax, **plot_kwargs)
 
-    if bool(labels):
+    if any(labels):
         ax0.legend([cax.get_lines()[0] for cax in axes], labels,
-                   loc='upper left', framealpha=plot_kwargs.pop('legend_framealpha', 0.9))
+                   loc='upper left', framealpha=legend_framealpha)
 
     if title:
         ax0.set_title(title, fontsize=14)
@@ -314,7 +438,7 @@ def plot_param_over_time_yshade(times, param, average='nanmean', shade='nanstd',
         Additional keyword arguments for the plot call.
     """
 
-    ax = check_ax(ax, plot_kwargs.pop('figsize', PLT_FIGSIZES['time']))
+    ax = check_ax(ax, plot_kwargs.pop('figsize', _TIME_FIGSIZE))
 
     times = np.arange(0, param.shape[-1]) if times is None else times
     plot_yshade(times, param, average=average, shade=shade, scale=scale,
@@ -8,7 +8,7 @@ They are not expected to be called directly by the user.
 
 from itertools import repeat
 from collections.abc import Iterator
-from functools import wraps
+from functools import lru_cache, wraps
 
 import numpy as np
 
@@ -44,6 +44,7 @@ def check_ax(ax, figsize=None):
     return ax
 
 
+@lru_cache(maxsize=32)
 def set_alpha(n_points):
     """Set an alpha value for plotting that is scaled by the number of points.
 
@@ -56,6 +57,11 @@ def set_alpha(n_points):
     -------
     alpha : float
         Value for alpha to use for plotting.
+
+    Notes
+    -----
+    Alpha is a pure function of the number of points, so results are memoized
+    across calls, which repeatedly use the same data sizes within a plot.
     """
 
     for key, val in PLT_ALPHA_LEVELS.items():
@@ -0,0 +1,83 @@
+"""Numba-accelerated generators for simulating model components.
+
+Notes
+-----
+These generators are only used if numba is available, and should be considered private.
+They mirror the aperiodic & periodic functions defined in `specparam.core.funcs`, and are
+only used on the simulation path - model fitting keeps the reference numpy functions.
+"""
+
+import numpy as np
+
+from specparam.core.modutils import safe_import
+
+###################################################################################################
+###################################################################################################
+
+# Resolved generators - False marks not yet resolved, None marks numba unavailable
+_generators = False
+
+def get_generators():
+    """Get the jit-compiled component generators, if available.
+
+    Returns
+    -------
+    generators : dict or None
+        The jit-compiled generators, with keys 'expo', 'expo_nk' & 'gaussian',
+        or None if numba is not available.
+
+    Notes
+    -----
+    The numba import and compilation are deferred until the first call,
+    so that importing the module does not pay the numba import cost.
+    """
+
+    global _generators
+    if _generators is False:
+
+        numba = safe_import('numba')
+        if numba:
+
+            @numba.njit(cache=True)
+            def expo_vals(freqs, offset, knee, exp):
+                """Generate aperiodic values, with a knee, matching `expo_function`."""
+
+                out = np.empty(freqs.size)
+                for ind in range(freqs.size):
+                    out[ind] = offset - np.log10(knee + freqs[ind] ** exp)
+
+                return out
+
+            @numba.njit(cache=True)
+            def expo_nk_vals(freqs, offset, exp):
+                """Generate aperiodic values, without a knee, matching `expo_nk_function`."""
+
+                out = np.empty(freqs.size)
+                for ind in range(freqs.size):
+                    out[ind] = offset - np.log10(freqs[ind] ** exp)
+
+                return out
+
+            @numba.njit(cache=True)
+            def gaussian_vals(freqs, params):
+                """Generate periodic values, matching `gaussian_function`.
+
+                Peak parameters are passed as a flattened 1d array of (ctr, hgt, wid) triples.
+                """
+
+                out = np.zeros(freqs.size)
+                for pind in range(0, len(params), 3):
+                    ctr, hgt, wid = params[pind], params[pind+1], params[pind+2]
+                    for ind in range(freqs.size):
+                        out[ind] += hgt * np.exp(-(freqs[ind] - ctr) ** 2 / (2 * wid ** 2))
+
+                return out
+
+            _generators = {'expo' : expo_vals,
+                           'expo_nk' : expo_nk_vals,
+                           'gaussian' : gaussian_vals}
+
+        else:
+            _generators = None
+
+    return _generators
@@ -4,6 +4,7 @@ import numpy as np
 
 from specparam.core.funcs import get_ap_func, get_pe_func, infer_ap_func
 
+from specparam.sim._numba import get_generators
 from specparam.sim.transform import rotate_spectrum
 
 ###################################################################################################
@@ -119,6 +120,44 @@ def gen_noise(freqs, nlv):
     return noise_vals
 
 
+def _sim_aperiodic(freqs, aperiodic_params):
+    """Generate aperiodic values for simulated spectra, jit-compiled if available.
+
+    Private counterpart of `gen_aperiodic` for the simulation path only - model
+    fitting keeps the reference numpy functions, so that fit outputs do not
+    depend on whether numba is installed.
+    """
+
+    generators = get_generators()
+    if generators is not None:
+
+        aperiodic_mode = infer_ap_func(aperiodic_params)
+        if aperiodic_mode == 'fixed':
+            offset, exp = aperiodic_params
+            return generators['expo_nk'](np.asarray(freqs, dtype=np.float64),
+                                         float(offset), float(exp))
+        if aperiodic_mode == 'knee':
+            offset, knee, exp = aperiodic_params
+            return generators['expo'](np.asarray(freqs, dtype=np.float64),
+                                      float(offset), float(knee), float(exp))
+
+    return gen_aperiodic(freqs, aperiodic_params)
+
+
+def _sim_periodic(freqs, periodic_params):
+    """Generate periodic values for simulated spectra, jit-compiled if available.
+
+    Private counterpart of `gen_periodic` (gaussian mode) for the simulation path only.
+    """
+
+    generators = get_generators()
+    if generators is not None:
+        return generators['gaussian'](np.asarray(freqs, dtype=np.float64),
+                                      np.asarray(periodic_params, dtype=np.float64))
+
+    return gen_periodic(freqs, periodic_params)
+
+
 def gen_power_vals(freqs, aperiodic_params, periodic_params, nlv):
     """Generate power values for a simulated power spectrum.
 
@@ -146,8 +185,8 @@ def gen_power_vals(freqs, aperiodic_params, periodic_params, nlv):
     - Returns the power spectrum in linear spacing, as is used for simulating power spectra.
     """
 
-    ap_vals = gen_aperiodic(freqs, aperiodic_params)
-    pe_vals = gen_periodic(freqs, periodic_params)
+    ap_vals = _sim_aperiodic(freqs, aperiodic_params)
+    pe_vals = _sim_periodic(freqs, periodic_params)
     noise = gen_noise(freqs, nlv)
 
     powers = np.power(10, ap_vals + pe_vals + noise)
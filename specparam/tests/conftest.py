@@ -7,8 +7,9 @@ import pytest
 import numpy as np
 
 from specparam.core.modutils import safe_import
+from specparam.sim.sim import sim_group_power_spectra
 from specparam.tests.tutils import (get_tfm, get_tfg, get_tft, get_tfe, get_tbands,
-                                    get_tresults, get_tdocstring)
+                                    get_tresults, get_tdocstring, default_group_params)
 from specparam.tests.settings import (BASE_TEST_FILE_PATH, TEST_DATA_PATH,
                                       TEST_REPORTS_PATH, TEST_PLOTS_PATH)
 
@@ -22,6 +23,26 @@ def pytest_configure(config):
         plt.switch_backend('agg')
     np.random.seed(13)
 
+    # Optionally pre-warm jit-compiled helpers, so their on-disk compiled artifacts
+    #   are loaded up front, rather than on first use within a test
+    if os.environ.get('SPECPARAM_PREWARM_JIT'):
+        from specparam.plts._numba_hist import get_hist1d
+        hist1d = get_hist1d()
+        if hist1d is not None:
+            hist1d(np.zeros(8), 0., 1., 8, np.zeros(8, dtype=np.int64))
+        from specparam.sim._numba import get_generators
+        generators = get_generators()
+        if generators is not None:
+            freqs = np.linspace(1, 40, 8)
+            generators['expo_nk'](freqs, 0., 1.)
+            generators['expo'](freqs, 0., 0., 1.)
+            generators['gaussian'](freqs, np.array([10., 0.5, 2.]))
+
+@pytest.fixture(autouse=True)
+def reset_seed():
+    """Re-seed the random state per test, so tests do not depend on execution order."""
+    np.random.seed(13)
+
 @pytest.fixture(scope='session', autouse=True)
 def check_dir():
     """Once, prior to session, this will clear and re-initialize the test file directories."""
@@ -41,8 +62,13 @@ def tfm():
     yield get_tfm()
 
 @pytest.fixture(scope='session')
-def tfg():
-    yield get_tfg()
+def synth_spectra():
+    """Simulate the group power spectra once per session, shared across fixtures."""
+    yield sim_group_power_spectra(3, *default_group_params())
+
+@pytest.fixture(scope='session')
+def tfg(synth_spectra):
+    yield get_tfg(synth_spectra)
 
 @pytest.fixture(scope='session')
 def tft():
@@ -64,6 +90,44 @@ def tresults():
 def tdocstring():
     yield get_tdocstring()
 
+@pytest.fixture(scope='session')
+def _session_ax():
+    """Create a single figure & axis to be reused across plot tests."""
+
+    if not plt:
+        pytest.skip('Matplotlib not available: skipping test.')
+
+    _, ax = plt.subplots()
+    yield ax
+
+@pytest.fixture
+def shared_ax(_session_ax):
+    """Provide the session plot axis, cleared, avoiding per-test figure creation."""
+
+    # Drop any extra axes added to the shared figure (ex: twinx), & clear the main axis
+    for extra in _session_ax.figure.axes:
+        if extra is not _session_ax:
+            extra.remove()
+    _session_ax.clear()
+
+    yield _session_ax
+
+@pytest.fixture
+def fast_plots(monkeypatch):
+    """Stub out heavy axes draw calls, to speed up smoke tests of plot functions.
+
+    Only active if the SPECPARAM_FAST_PLOTS environment variable is set.
+    Opt-in per test, and only for tests that check no more than that something was plotted.
+    """
+
+    if plt and os.environ.get('SPECPARAM_FAST_PLOTS'):
+
+        def _stub(self, *args, **kwargs):
+            return self.plot([0], [0])
+
+        for method in ['scatter', 'hist', 'bar']:
+            monkeypatch.setattr('matplotlib.axes.Axes.' + method, _stub)
+
 @pytest.fixture(scope='session')
 def skip_if_no_mpl():
     if not safe_import('matplotlib'):
@@ -0,0 +1,50 @@
+"""Tests for specparam.plts._numba_hist."""
+
+import numpy as np
+import pytest
+
+from specparam.plts._numba_hist import *
+
+###################################################################################################
+###################################################################################################
+
+def test_get_hist1d():
+
+    hist1d = get_hist1d()
+    if hist1d is None:
+        pytest.skip('Numba not available: skipping test.')
+
+    # Resolving again should hand back the same compiled function
+    assert get_hist1d() is hist1d
+
+def test_hist1d():
+
+    hist1d = get_hist1d()
+    if hist1d is None:
+        pytest.skip('Numba not available: skipping test.')
+
+    n_bins = 10
+    rng = np.random.default_rng(13)
+
+    for _ in range(10):
+
+        data = rng.normal(size=500)
+
+        # Check counts match np.histogram, across the full data range
+        lo, hi = float(np.min(data)), float(np.max(data))
+        counts = np.zeros(n_bins, dtype=np.int64)
+        hist1d(data, lo, hi, n_bins, counts)
+        assert np.array_equal(counts, np.histogram(data, n_bins, range=(lo, hi))[0])
+
+        # Check counts match np.histogram for a restricted range, with out-of-range values
+        lo, hi = -1., 1.
+        counts = np.zeros(n_bins, dtype=np.int64)
+        hist1d(data, lo, hi, n_bins, counts)
+        assert np.array_equal(counts, np.histogram(data, n_bins, range=(lo, hi))[0])
+
+    # Check values just below the range are excluded, & the upper bound is counted
+    data = np.array([-0.05, 0.0, 0.5, 1.0, 1.05])
+    counts = np.zeros(n_bins, dtype=np.int64)
+    hist1d(data, 0.0, 1.0, n_bins, counts)
+    assert np.array_equal(counts, np.histogram(data, n_bins, range=(0.0, 1.0))[0])
+    assert np.sum(counts) == 3
@@ -1,6 +1,7 @@
 """Tests for specparam.plts.templates."""
 
 import numpy as np
+import pytest
 
 from specparam.core.modutils import safe_import
 
@@ -13,55 +14,69 @@ mpl = safe_import('matplotlib')
 ###################################################################################################
 ###################################################################################################
 
+@pytest.mark.usefixtures('fast_plots')
 @plot_test
-def test_plot_scatter_1(skip_if_no_mpl):
+def test_plot_scatter_1(skip_if_no_mpl, shared_ax):
 
     data = np.random.randint(0, 100, 100)
 
-    plot_scatter_1(data, 'label', 'title')
+    plot_scatter_1(data, 'label', 'title', ax=shared_ax)
 
+@pytest.mark.usefixtures('fast_plots')
 @plot_test
-def test_plot_scatter_2(skip_if_no_mpl):
+def test_plot_scatter_2(skip_if_no_mpl, shared_ax):
 
     data1 = np.random.randint(0, 100, 100)
     data2 = np.random.randint(0, 100, 100)
 
-    plot_scatter_2(data1, 'label1', data2, 'label2', 'title')
+    plot_scatter_2(data1, 'label1', data2, 'label2', 'title', ax=shared_ax)
 
+@pytest.mark.usefixtures('fast_plots')
 @plot_test
-def test_plot_hist(skip_if_no_mpl):
+def test_plot_scatter_n(skip_if_no_mpl, shared_ax):
+
+    data1 = np.random.randint(0, 100, 100)
+    data2 = np.random.randint(0, 100, 100)
+
+    plot_scatter_n([data1, data2], ['label1', 'label2'], 'title', ax=shared_ax)
+
+@pytest.mark.usefixtures('fast_plots')
+@plot_test
+def test_plot_hist(skip_if_no_mpl, shared_ax):
 
     data = np.random.randint(0, 100, 100)
-    plot_hist(data, 'label', 'title')
+    plot_hist(data, 'label', 'title', ax=shared_ax)
+    plot_hist(data, 'label', 'title', skip_nan_check=True, ax=shared_ax)
 
 @plot_test
-def test_plot_yshade(skip_if_no_mpl):
+def test_plot_yshade(skip_if_no_mpl, shared_ax):
 
     xs = np.array([1, 2, 3])
     ys = np.array([[1, 2, 3], [2, 3, 4]])
-    plot_yshade(xs, ys)
+    plot_yshade(xs, ys, ax=shared_ax)
 
 @plot_test
-def test_plot_param_over_time(skip_if_no_mpl):
+def test_plot_param_over_time(skip_if_no_mpl, shared_ax):
 
     param = np.array([1, 2, 3, 2, 1, 2, 4, 2, 3, 2, 1])
 
-    plot_param_over_time(None, param, label='param', color='red')
+    plot_param_over_time(None, param, label='param', color='red', ax=shared_ax)
 
 @plot_test
-def test_plot_params_over_time(skip_if_no_mpl):
+def test_plot_params_over_time(skip_if_no_mpl, shared_ax):
 
     params = [np.array([1, 2, 3, 2, 1, 2, 4, 2, 3, 2, 1]),
               np.array([2, 3, 2, 1, 2, 4, 2, 3, 2, 1, 2])]
 
-    plot_params_over_time(None, params, labels=['param1', 'param2'], colors=['blue', 'red'])
+    plot_params_over_time(None, params, labels=['param1', 'param2'], colors=['blue', 'red'],
+                          ax=shared_ax)
 
 @plot_test
-def test_plot_param_over_time_yshade(skip_if_no_mpl):
+def test_plot_param_over_time_yshade(skip_if_no_mpl, shared_ax):
 
     params = np.array([[1, 2, 3, 2, 1, 2, 4, 2, 3, 2, 1],
                        [2, 3, 2, 1, 2, 4, 2, 3, 2, 1, 2]])
-    plot_param_over_time_yshade(None, params)
+    plot_param_over_time_yshade(None, params, ax=shared_ax)
 
 def test_plot_text(skip_if_no_mpl):
 
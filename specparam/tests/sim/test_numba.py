@@ -0,0 +1,38 @@
+"""Tests for specparam.sim._numba."""
+
+import numpy as np
+import pytest
+
+from specparam.core.funcs import expo_function, expo_nk_function, gaussian_function
+
+from specparam.sim._numba import *
+
+###################################################################################################
+###################################################################################################
+
+def test_get_generators():
+
+    generators = get_generators()
+    if generators is None:
+        pytest.skip('Numba not available: skipping test.')
+
+    # Resolving again should hand back the same compiled functions
+    assert get_generators() is generators
+
+def test_generators_match_reference_funcs():
+
+    generators = get_generators()
+    if generators is None:
+        pytest.skip('Numba not available: skipping test.')
+
+    freqs = np.arange(3, 50.5, 0.5)
+
+    assert np.allclose(generators['expo_nk'](freqs, 50., 2.),
+                       expo_nk_function(freqs, 50, 2))
+    assert np.allclose(generators['expo'](freqs, 50., 10., 2.),
+                       expo_function(freqs, 50, 10, 2))
+
+    gauss_params = [10, 0.5, 2, 20, 0.3, 4]
+    assert np.allclose(generators['gaussian'](freqs, np.array(gauss_params, dtype=np.float64)),
+                       gaussian_function(freqs, *gauss_params))
+    assert np.array_equal(generators['gaussian'](freqs, np.empty(0)), np.zeros(freqs.size))
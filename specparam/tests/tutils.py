@@ -31,11 +31,16 @@ def get_tfm():
 
     return tfm
 
-def get_tfg():
-    """Get a group object, with some fit power spectra, for testing."""
+def get_tfg(spectra=None):
+    """Get a group object, with some fit power spectra, for testing.
 
-    n_spectra = 3
-    xs, ys = sim_group_power_spectra(n_spectra, *default_group_params())
+    Optionally accepts pre-simulated spectra, as (xs, ys), to avoid re-simulating.
+    """
+
+    if spectra is None:
+        n_spectra = 3
+        spectra = sim_group_power_spectra(n_spectra, *default_group_params())
+    xs, ys = spectra
 
     tfg = SpectralGroupModel(verbose=False)
     tfg.fit(xs, ys)
@@ -118,16 +123,22 @@ def plot_test(func):
     This decorator closes all plots prior to the test.
     After running the test function, it checks an axis was created with data.
     It therefore performs a minimal test - asserting the plots exists, with no accuracy checking.
+
+    If the test uses the `shared_ax` fixture, the check is run on the shared axis instead,
+    and pre-existing figures are left open, so the shared figure can be reused across tests.
     """
 
     @wraps(func)
     def wrapper(*args, **kwargs):
 
-        plt.close('all')
+        shared_ax = kwargs.get('shared_ax', None)
+
+        if shared_ax is None:
+            plt.close('all')
 
         func(*args, **kwargs)
 
-        ax = plt.gca()
+        ax = shared_ax if shared_ax is not None else plt.gca()
         assert ax.has_data()
 
     return wrapper